@@ -19,9 +19,10 @@ a = Analysis(
         'PIL.Image',
         'PIL.ImageQt',
         'PIL._webp',
-        'flask',
-        'flask_cors',
         'psutil',
+        'ahocorasick',  # 차단 키워드 다중 매칭 (없으면 정규식 폴백)
+        'wmi',          # Windows 프로세스 생성 이벤트 구독 (없으면 폴링 폴백)
+        'pythoncom',
         'PyQt6.QtCore',
         'PyQt6.QtGui',
         'PyQt6.QtWidgets',
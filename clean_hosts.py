@@ -6,9 +6,19 @@ Kept for backwards compatibility: `python clean_hosts.py`.
 from __future__ import annotations
 
 import os
-import runpy
+import sys
 
 
 if __name__ == "__main__":
+    # runpy.run_path는 매번 소스를 다시 읽고 컴파일하므로
+    # 일반 임포트(.pyc 캐시 사용)로 대체
     repo_root = os.path.dirname(os.path.abspath(__file__))
-    runpy.run_path(os.path.join(repo_root, "scripts", "clean_hosts.py"), run_name="__main__")
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+    from scripts.clean_hosts import clean_hosts, is_admin, run_as_admin
+
+    if not is_admin():
+        run_as_admin()
+    else:
+        clean_hosts()
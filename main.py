@@ -9,8 +9,17 @@ import os
 import sys
 
 
+_PATH_READY = False
+
+
 def _ensure_src_on_path() -> None:
     """src 디렉토리를 sys.path에 추가 (개발 환경 및 PyInstaller 환경 모두 지원)"""
+    global _PATH_READY
+    # 한 번 설정한 뒤에는 sys.path 전체를 다시 훑지 않음
+    if _PATH_READY:
+        return
+    _PATH_READY = True
+
     # PyInstaller로 빌드된 경우
     if getattr(sys, 'frozen', False):
         # PyInstaller는 pathex=['src']를 사용하여 분석 시 모듈을 찾지만,
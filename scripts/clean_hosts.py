@@ -1,12 +1,20 @@
 # clean_hosts.py
 import ctypes
+import functools
 import os
 import platform
+import shutil
+import subprocess
 import sys
+import tempfile
 
+# OS 판별은 바뀌지 않으므로 임포트 시점에 한 번만 계산
+_IS_WINDOWS = platform.system() == "Windows"
+
+@functools.lru_cache(maxsize=1)
 def is_admin():
-    system = platform.system()
-    if system == "Windows":
+    # 권한은 프로세스 수명 동안 변하지 않으므로 결과를 캐싱
+    if _IS_WINDOWS:
         try:
             return bool(ctypes.windll.shell32.IsUserAnAdmin())
         except Exception:
@@ -17,49 +25,70 @@ def is_admin():
         return False
 
 def run_as_admin():
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         print("이 스크립트는 Windows에서만 자동 관리자 권한 실행을 지원합니다.")
         return
 
     script = os.path.abspath(sys.argv[0])
-    params = " ".join([script] + sys.argv[1:])
-    ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
+    # 공백이 들어간 경로도 안전하게 전달되도록 Windows 규칙으로 인용
+    params = subprocess.list2cmdline([script] + sys.argv[1:])
+    result = ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
+    if result > 32:
+        # 관리자 프로세스가 새로 시작되었으므로 현재 프로세스는 종료
+        sys.exit(0)
 
 def clean_hosts():
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         hosts_path = r"C:\Windows\System32\drivers\etc\hosts"
     else:
         hosts_path = "/etc/hosts"
 
-    try:
-        with open(hosts_path, 'r', encoding='utf-8', errors='ignore') as file:
-            lines = file.readlines()
+    # Study With 앱이 남긴 마커 찾기 (항상 한 줄 전체를 차지함)
+    MARKER_START = "# --- STUDY WITH BLOCK START ---"
+    MARKER_END = "# --- STUDY WITH BLOCK END ---"
 
-        # Study With 앱이 남긴 마커 찾기
-        MARKER_START = "# --- STUDY WITH BLOCK START ---\n"
-        MARKER_END = "# --- STUDY WITH BLOCK END ---\n"
+    try:
+        # 한 줄씩 읽어 남길 줄만 모아 뒀다가 같은 디렉토리의 임시 파일에
+        # 한 번에 기록한 뒤, os.replace로 원자적으로 교체
+        dst = tempfile.NamedTemporaryFile(
+            'w', dir=os.path.dirname(hosts_path), delete=False,
+            encoding='utf-8', prefix='hosts.', suffix='.tmp')
 
-        new_lines = []
         in_block = False
         found = False
+        kept = []
 
-        for line in lines:
-            if MARKER_START in line:
-                in_block = True
-                found = True
-                continue
-            if MARKER_END in line:
-                in_block = False
-                continue
-            
-            if not in_block:
-                new_lines.append(line)
+        try:
+            with open(hosts_path, 'r', encoding='utf-8', errors='ignore') as src, dst:
+                for line in src:
+                    # 마커는 항상 독립된 한 줄이므로 부분 문자열 검색 대신
+                    # 공백 제거 후 완전 일치 비교 (첫 글자가 다르면 바로 탈락)
+                    stripped = line.strip()
+                    if stripped == MARKER_START:
+                        in_block = True
+                        found = True
+                        continue
+                    if stripped == MARKER_END:
+                        in_block = False
+                        continue
+
+                    if not in_block:
+                        kept.append(line)
+
+                # 줄 단위 write 수천 번 대신 합쳐서 한 번에 기록
+                dst.write("".join(kept))
+        except Exception:
+            os.unlink(dst.name)
+            raise
 
         if found:
-            with open(hosts_path, 'w', encoding='utf-8') as file:
-                file.writelines(new_lines)
+            # NamedTemporaryFile은 0600으로 생성되므로 교체 전에 원본
+            # 권한을 그대로 복사 (hosts는 모든 프로세스가 읽어야 함)
+            shutil.copymode(hosts_path, dst.name)
+            os.replace(dst.name, hosts_path)
             print("✅ Hosts 파일 복구 완료! 차단된 사이트들이 해제되었습니다.")
         else:
+            os.unlink(dst.name)
             print("ℹ️ Hosts 파일에서 'Study With' 차단 내역을 찾을 수 없습니다.")
 
     except Exception as e:
@@ -1,36 +1,47 @@
 from __future__ import annotations
 
 import ctypes
+import functools
+import hashlib
+import json
 import os
 import platform
 import random
+import re
 import shutil
+import signal
+import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import psutil
-from PyQt6.QtCore import QThread, QTimer, Qt, QUrl, pyqtSignal
+from PyQt6.QtCore import (QObject, QRunnable, QThread, QThreadPool, QTimer,
+                          Qt, QUrl, pyqtSignal)
 from PyQt6.QtGui import QFont, QFontDatabase
-from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
 
 from .ui import PipUI, StudyWithUI
 from .session_manager import SessionManager
 from .rank_themes import get_theme
 
-# Flask 관련 (확장 프로그램 연동용)
-from flask import Flask, jsonify
-from flask_cors import CORS
+# psutil은 무겁기 때문에 실제로 쓰는 시점(BlockerWorker)에서 지연 임포트한다.
 
+# OS 판별은 바뀌지 않으므로 임포트 시점에 한 번만 계산
+_IS_WINDOWS = platform.system() == "Windows"
+
+
+@functools.lru_cache(maxsize=1)
 def _resources_dir() -> Path:
     """
     Return the directory containing packaged resources.
 
     - Dev: <repo>/src/study_with/resources
     - PyInstaller: <_MEIPASS>/resources (when collected as data)
+
+    The location is fixed for the process lifetime, so the result is cached.
     """
     meipass = getattr(sys, "_MEIPASS", None)
     if meipass:
@@ -38,22 +49,40 @@ def _resources_dir() -> Path:
     return Path(__file__).resolve().parent / "resources"
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(*relative_parts: str) -> str:
-    """Build an absolute path to a resource file."""
+    """Build an absolute path to a resource file (memoized per argument set)."""
     return str(_resources_dir().joinpath(*relative_parts))
 
 
+# _default_preset_dir가 프리셋 디렉토리를 방금 새로 만들었는지 기록
+# (_ensure_default_preset이 빈 디렉토리를 다시 스캔하지 않도록)
+_preset_dir_created = False
+
+
+def _mkdir_tracked(p: Path) -> None:
+    """디렉토리를 만들고, 실제로 새로 생성됐는지 여부를 기록"""
+    global _preset_dir_created
+    try:
+        p.mkdir(parents=True)
+        _preset_dir_created = True
+    except FileExistsError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def _default_preset_dir() -> Path:
+    # 결과는 프로세스 수명 동안 변하지 않으므로 캐싱
+    # (환경 변수 조회 + mkdir 시스템 호출을 첫 호출 한 번으로 줄임)
     # Backward-compat: if a legacy ./block_list exists, keep using it.
     legacy = Path.cwd() / "block_list"
     if legacy.exists():
-        legacy.mkdir(parents=True, exist_ok=True)
         return legacy
 
     override = os.getenv("STUDY_WITH_PRESET_DIR")
     if override:
         p = Path(override).expanduser()
-        p.mkdir(parents=True, exist_ok=True)
+        _mkdir_tracked(p)
         return p
 
     system = platform.system()
@@ -66,30 +95,48 @@ def _default_preset_dir() -> Path:
         base = Path(os.getenv("XDG_DATA_HOME", str(Path.home() / ".local" / "share")))
         preset_dir = base / "study-with" / "presets"
 
-    preset_dir.mkdir(parents=True, exist_ok=True)
+    _mkdir_tracked(preset_dir)
     return preset_dir
 
 
 def _ensure_default_preset(preset_dir: Path) -> None:
     """Copy the bundled Default preset if the directory is empty."""
-    try:
-        has_any_txt = any(p.suffix.lower() == ".txt" for p in preset_dir.iterdir() if p.is_file())
-    except Exception:
+    # 한 번 확인이 끝난 디렉토리는 센티널 파일로 표시해 두고
+    # 이후 실행에서는 스캔 없이 stat 한 번으로 끝낸다
+    sentinel = preset_dir / ".initialized"
+    if sentinel.exists():
         return
 
-    if has_any_txt:
-        return
-
-    bundled = Path(resource_path("presets", "Default.txt"))
-    if bundled.exists():
+    if _preset_dir_created:
+        # 방금 만든 빈 디렉토리면 스캔 자체를 생략
+        has_any_txt = False
+    else:
         try:
-            shutil.copy2(bundled, preset_dir / "Default.txt")
+            with os.scandir(preset_dir) as it:
+                # 첫 프리셋 파일을 만나는 즉시 중단 (전체 목록을 만들지 않음)
+                has_any_txt = any(
+                    e.name.lower().endswith((".txt", ".json")) and e.is_file()
+                    for e in it)
         except Exception:
-            pass
+            return
 
+    if not has_any_txt:
+        bundled = Path(resource_path("presets", "Default.txt"))
+        if bundled.exists():
+            try:
+                shutil.copy2(bundled, preset_dir / "Default.txt")
+            except Exception:
+                return
+
+    try:
+        sentinel.touch()
+    except Exception:
+        pass
 
+
+@functools.lru_cache(maxsize=1)
 def _get_config_dir() -> Path:
-    """설정 파일 저장 디렉토리 반환"""
+    """설정 파일 저장 디렉토리 반환 (첫 호출 때만 경로 계산 + mkdir)"""
     system = platform.system()
     if system == "Windows":
         base = Path(os.getenv("APPDATA", str(Path.home() / "AppData" / "Roaming")))
@@ -136,9 +183,10 @@ def load_last_preset_path() -> Optional[str]:
 # ---------------------------------------------------------
 # [로직 1] 관리자 권한 체크
 # ---------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def is_admin():
-    system = platform.system()
-    if system == "Windows":
+    # 권한은 프로세스 수명 동안 변하지 않으므로 결과를 캐싱
+    if _IS_WINDOWS:
         try:
             return bool(ctypes.windll.shell32.IsUserAnAdmin())
         except Exception:
@@ -151,11 +199,16 @@ def is_admin():
 
 def run_as_admin():
     # Only Windows supports ShellExecute "runas" here.
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return False
 
     script = os.path.abspath(sys.argv[0])
-    params = " ".join([script] + sys.argv[1:])
+    # 공백이 들어간 경로도 안전하게 전달되도록 Windows 규칙으로 인용.
+    # '--elevated'는 승격 경계를 넘어 전달되는 argv 마커 — 환경 변수는
+    # ShellExecuteW("runas") 자식에게 전달되지 않으므로 인자로 표시해서
+    # 승격된(또는 승격에 실패한) 자식이 재승격을 다시 시도하지 않게 한다
+    args = [a for a in sys.argv[1:] if a != '--elevated']
+    params = subprocess.list2cmdline([script] + args + ['--elevated'])
     try:
         # 관리자 권한으로 재실행
         result = ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
@@ -171,111 +224,407 @@ def run_as_admin():
         return False
 
 # ---------------------------------------------------------
-# [로직 2] 백그라운드 스레드들 (Flask API, 프로세스 차단기)
+# [로직 2] 백그라운드 스레드들 (상태 API 서버, 프로세스 차단기)
 # ---------------------------------------------------------
 class ApiServerThread(QThread):
+    """확장 프로그램에 /status JSON을 제공하는 경량 HTTP 서버 스레드
+
+    필드 2개짜리 JSON 하나를 돌려주는 용도로는 Flask + CORS 스택이
+    과하므로(임포트만으로 수십 MB), 표준 라이브러리 http.server로
+    직접 처리한다.
+    """
+
     def __init__(self):
         super().__init__()
-        self.app = Flask(__name__)
-        CORS(self.app)
         self.port = 5000
         self.is_blocking = False
         self.block_sites = []
-
-        @self.app.route('/status')
-        def get_status():
-            return jsonify({"blocking": self.is_blocking, "sites": self.block_sites})
+        self._server = None
+        # 상태가 바뀔 때 한 번만 직렬화해 두고 요청마다 그대로 반환.
+        # (본문, ETag)를 튜플 하나에 담아 단일 대입/단일 읽기로만 접근
+        # — 핸들러 스레드가 새 본문에 옛 ETag를 섞어 보는 일이 없다
+        self._status = (b"", "")
+        self._set_status_body(False, [])
+
+    def _set_status_body(self, blocking, sites):
+        """상태 본문과 ETag를 한 번만 계산해서 보관"""
+        body = json.dumps(
+            {"blocking": blocking, "sites": list(sites)},
+            separators=(',', ':')).encode('utf-8')
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+        self._status = (body, etag)
 
     def run(self):
-        import logging
-        log = logging.getLogger('werkzeug')
-        log.setLevel(logging.ERROR)
-        self.app.run(port=self.port, use_reloader=False)
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        owner = self
+
+        class _StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != '/status':
+                    self.send_error(404)
+                    return
+                # 튜플 읽기 한 번이므로 update_state의 교체와 경합하지 않음
+                body, etag = owner._status
+                if self.headers.get('If-None-Match') == etag:
+                    # 같은 상태를 다시 물으면 본문 없이 304로 응답
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Access-Control-Allow-Origin', '*')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'max-age=1')
+                # 확장 프로그램이 접근할 수 있도록 CORS 허용
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 콘솔에 찍히는 접근 로그 제거
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), _StatusHandler)
+        self._server.daemon_threads = True
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.quit()
+        self.wait()
 
     def update_state(self, blocking, sites):
         self.is_blocking = blocking
         self.block_sites = sites
+        self._set_status_body(blocking, sites)
 
 class BlockerWorker(QThread):
-    log_signal = pyqtSignal(str, str)
+    # (메시지, 유형) 튜플의 리스트를 한 번에 전달
+    # 킬 폭주 시 스레드 간 시그널 N번 대신 틱당 1번만 GUI 스레드를 깨운다
+    log_signal = pyqtSignal(list)
     blocked_signal = pyqtSignal(str)  # 차단 발생 시 프로그램 이름 전달
 
     def __init__(self, block_keywords):
         super().__init__()
-        self.running = True
-        # 대소문자 구분 없이 비교하기 위해 미리 소문자로 변환
-        self.block_keywords = [k.lower().strip() for k in block_keywords if k.strip()]
+        # 단순 bool 플래그 대신 Event: 스레드 간 가시성이 보장되고
+        # 필요 시 wait(timeout)으로 즉시 깨어날 수 있음
+        self._stop_evt = threading.Event()
+        self._log_buf = []  # 틱 동안 쌓았다가 한 번에 emit
+        # 호출 측(start_session)에서 이미 소문자/공백 정규화를 마친 튜플을 받음
+        self.block_keywords = tuple(block_keywords)
         
         # [중요] 절대 종료하면 안 되는 시스템 필수 프로세스 목록 (화이트리스트)
         self.safe_list = [
-            'windows', 'system', 'svchost.exe', 'explorer.exe', 
+            'windows', 'system', 'svchost.exe', 'explorer.exe',
             'winlogon.exe', 'csrss.exe', 'services.exe', 'lsass.exe',
             'dwm.exe', 'smss.exe', 'taskmgr.exe', 'spoolsv.exe',
             'python.exe', 'pythonw.exe', 'pycharm', 'code' # 개발 도구 포함
         ]
 
+        # 화이트리스트를 두 갈래로 분리:
+        #  - 정확한 파일명(.exe 등)은 frozenset 해시 조회 한 번으로 판정
+        #  - 'windows' 같은 잔여 항목은 접두사(startswith) 비교
+        #    (부분 문자열 검색은 'code'가 들어간 무관한 이름까지
+        #     잘못 보호하므로 접두사 일치로 좁힌다)
+        # 항목은 전부 소문자로 통일하고, 잔여 항목은 짧은 것부터 정렬
+        safe_lower = tuple(s.lower() for s in self.safe_list)
+        self.safe_exact = frozenset(s for s in safe_lower if s.endswith('.exe'))
+        self.safe_prefix = tuple(sorted(
+            (s for s in safe_lower if not s.endswith('.exe')), key=len))
+
+        # 키워드 목록을 Aho-Corasick 오토마톤으로 미리 컴파일
+        # (프로세스 이름 1개당 C 레벨 스캔 1번으로 모든 패턴을 동시에 검사)
+        self._block_automaton = self._build_automaton(self.block_keywords)
+
+        # pyahocorasick이 없으면 컴파일된 정규식 교대 패턴으로 폴백
+        # (파이썬 루프 N회 대신 C 레벨 스캔 한 번)
+        self._block_re = None
+        if self._block_automaton is None and self.block_keywords:
+            self._block_re = re.compile("|".join(map(re.escape, self.block_keywords)))
+
+    @staticmethod
+    def _build_automaton(words):
+        """pyahocorasick이 설치되어 있으면 오토마톤 생성, 아니면 None"""
+        if not words:
+            return None
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+
     def run(self):
-        if self.block_keywords:
-            self.log_signal.emit(f"프로그램 감시 중 (키워드: {', '.join(self.block_keywords)})", "INFO")
-        
-        while self.running:
-            if self.block_keywords:
-                # 현재 실행 중인 모든 프로세스 순회
-                for proc in psutil.process_iter(['pid', 'name']):
-                    try:
-                        # 프로세스 이름 가져오기
-                        proc_name = proc.info['name']
-                        if not proc_name: continue
-                        
-                        proc_name_lower = proc_name.lower()
-
-                        # 1. 안전 리스트에 있는 파일은 절대 건드리지 않음
-                        is_safe = False
-                        for safe_item in self.safe_list:
-                            if safe_item in proc_name_lower:
-                                is_safe = True
-                                break
-                        if is_safe:
-                            continue
-
-                        # 2. 차단 키워드가 프로세스 이름에 '포함'되어 있는지 확인
-                        for keyword in self.block_keywords:
-                            if keyword in proc_name_lower:
-                                proc.kill() # 강제 종료
-                                self.log_signal.emit(f"🚫 프로그램 차단됨: {proc_name} ('{keyword}' 포함)", "SUCCESS")
-                                self.blocked_signal.emit(proc_name)  # 차단 발생 시그널 전송
-                                break # 한 번 죽였으면 다음 프로세스로 넘어감
-
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        # 이미 종료되었거나 권한이 없는 시스템 프로세스는 무시
-                        pass
-                    except Exception as e:
-                        # self.log_signal.emit(f"오류: {e}", "ERROR") 
-                        pass
-                        
-            time.sleep(1) # 1초마다 검사
+        # 차단할 키워드가 없으면 스레드를 유지할 이유가 없음
+        # (빈 목록으로 1초마다 깨어나던 웨이크업 제거)
+        if not self.block_keywords:
+            return
+
+        self._log_buf.append(
+            (f"프로그램 감시 중 (키워드: {', '.join(self.block_keywords)})", "INFO"))
+        self._flush_logs()
+
+        # Windows에서는 WMI 프로세스 생성 이벤트 구독을 우선 사용
+        # (매초 전체 프로세스를 훑는 대신, 새 프로세스가 생길 때만 깨어남)
+        if _IS_WINDOWS and self._run_wmi_events():
+            return
+
+        # WMI를 쓸 수 없는 환경(Linux/macOS, wmi 미설치)은 폴링 방식 유지
+        self._run_polling()
+
+    def _check_name(self, proc_name):
+        """프로세스 이름이 차단 대상이면 매칭된 키워드, 아니면 None 반환"""
+        proc_name_lower = proc_name.lower()
+
+        # 1. 안전 리스트에 있는 파일은 절대 건드리지 않음
+        #    대부분은 정확한 파일명이므로 해시 조회 한 번으로 먼저 거르고,
+        #    나머지는 접두사 일치 한 번으로 판정
+        if proc_name_lower in self.safe_exact:
+            return None
+        if proc_name_lower.startswith(self.safe_prefix):
+            return None
+
+        # 2. 차단 키워드가 프로세스 이름에 '포함'되어 있는지 확인
+        if self._block_automaton is not None:
+            hit = next(self._block_automaton.iter(proc_name_lower), None)
+            return hit[1] if hit is not None else None
+        if self._block_re is not None:
+            m = self._block_re.search(proc_name_lower)
+            return m.group(0) if m else None
+        return None
+
+    # Win32 OpenProcess 접근 권한 플래그
+    _PROCESS_TERMINATE = 0x0001
+
+    def _kill_windows(self, pid):
+        """Win32 TerminateProcess를 직접 호출해서 종료 (성공 여부 반환)
+
+        PID를 이미 알고 있으므로 psutil 래퍼가 하는 프로세스 정보 재조회를
+        건너뛰고 핸들 열기/종료/닫기만 수행한다.
+        """
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(self._PROCESS_TERMINATE, False, pid)
+        if not handle:
+            return False
+        try:
+            return bool(kernel32.TerminateProcess(handle, 1))
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def _kill_and_report(self, pid, proc_name, keyword):
+        """매칭된 프로세스를 종료하고 시그널 전송"""
+        detail = ""
+        if _IS_WINDOWS:
+            try:
+                if not self._kill_windows(pid):
+                    return
+            except Exception:
+                return
+        elif sys.platform == 'linux':
+            # /proc 경로: psutil 없이 시그널로 바로 종료
+            try:
+                detail = f", 경로: {os.readlink(f'/proc/{pid}/exe')}"
+            except OSError:
+                pass
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                return
+        else:
+            import psutil
+            try:
+                proc = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                return
+            try:
+                # 로그에 쓸 속성을 oneshot으로 묶어 시스템 호출 1회에 조회
+                with proc.oneshot():
+                    exe = proc.exe()
+                if exe:
+                    detail = f", 경로: {exe}"
+            except Exception:
+                pass  # 경로 조회 실패는 무시하고 종료는 계속 진행
+            try:
+                proc.kill()  # 강제 종료
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                return
+        self._log_buf.append(
+            (f"🚫 프로그램 차단됨: {proc_name} ('{keyword}' 포함{detail})", "SUCCESS"))
+        self.blocked_signal.emit(proc_name)  # 차단 발생 시그널 전송
+
+    def _flush_logs(self):
+        """버퍼에 쌓인 로그를 시그널 한 번으로 묶어서 전달"""
+        if self._log_buf:
+            buf, self._log_buf = self._log_buf, []
+            self.log_signal.emit(buf)
+
+    def _run_wmi_events(self):
+        """Windows 전용: Win32_Process 생성 이벤트를 구독해서 새 프로세스만 검사
+
+        성공적으로 구독을 시작하면 True, WMI를 쓸 수 없으면 False 반환
+        (False면 호출 측에서 폴링 방식으로 폴백)
+        """
+        try:
+            import pythoncom
+            import wmi
+        except ImportError:
+            return False
+
+        try:
+            # QThread 안에서 COM을 쓰려면 스레드별 초기화 필요
+            pythoncom.CoInitialize()
+        except Exception:
+            return False
+
+        try:
+            watcher = wmi.WMI().Win32_Process.watch_for("creation")
+        except Exception:
+            pythoncom.CoUninitialize()
+            return False
+
+        try:
+            while not self._stop_evt.is_set():
+                try:
+                    # 타임아웃을 줘서 종료 이벤트를 주기적으로 확인
+                    event = watcher(timeout_ms=500)
+                except wmi.x_wmi_timed_out:
+                    continue
+                except Exception:
+                    continue
+
+                try:
+                    proc_name = event.Name or ""
+                    keyword = self._check_name(proc_name)
+                    if keyword:
+                        self._kill_and_report(int(event.ProcessId), proc_name, keyword)
+                except Exception:
+                    pass
+                self._flush_logs()
+        finally:
+            pythoncom.CoUninitialize()
+        return True
+
+    def _run_polling(self):
+        """폴백 경로: 1초마다 PID 목록을 훑되, 이름은 새 PID만 조회
+
+        time.sleep 대신 stop 이벤트를 타임아웃 대기해서 슬립 중 GIL을
+        잡지 않고, stop() 호출 시 즉시 깨어난다. 검사는 전부 이 워커
+        스레드 안에서 돌아 UI 스레드를 막지 않는다.
+        """
+        # Linux는 /proc를 직접 읽는 쪽이 psutil 래퍼보다 훨씬 싸므로
+        # psutil 임포트 자체를 건너뛴다
+        if sys.platform == 'linux':
+            tick = self._poll_tick_proc
+        else:
+            import psutil
+            self._psutil = psutil
+            tick = self._poll_tick_psutil
+
+        # PID -> 이름 캐시. 프로세스 이름은 PID 수명 동안 바뀌지 않으므로
+        # 한 번 검사한 PID는 사라질 때까지 커널에서 다시 읽지 않는다.
+        self._seen = {}
+
+        tick()  # 기다리지 않고 즉시 첫 검사
+        while not self._stop_evt.wait(1.0):  # 1초마다 검사
+            tick()
+
+    def _poll_tick_proc(self):
+        """Linux 전용 폴링 1회분: /proc를 직접 읽어 래퍼 비용 제거
+
+        프로세스당 필요한 건 이름뿐이므로 readdir 한 번 + 새 PID의
+        /proc/<pid>/comm 읽기 한 번이면 충분하다.
+        """
+        seen = self._seen
+        current_pids = set()
+
+        for entry in os.scandir('/proc'):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            current_pids.add(pid)
+            if pid in seen:
+                continue
+            try:
+                # comm은 실행 파일 이름 한 줄 (open + read 각 1회)
+                with open(f'/proc/{pid}/comm', 'rb') as f:
+                    proc_name = f.read().rstrip(b'\n').decode('utf-8', 'replace')
+            except OSError:
+                seen[pid] = ''
+                continue
+            seen[pid] = proc_name
+
+            keyword = self._check_name(proc_name)
+            if keyword:
+                self._kill_and_report(pid, proc_name, keyword)
+
+        # 죽은 PID의 캐시 정리
+        for pid in seen.keys() - current_pids:
+            del seen[pid]
+
+        self._flush_logs()
+
+    def _poll_tick_psutil(self):
+        """폴링 1회분: PID 목록을 읽어 새 PID만 이름 조회 후 검사"""
+        psutil = self._psutil
+        seen = self._seen
+
+        current_pids = set(psutil.pids())  # 저렴한 PID 목록 한 번
+
+        # 죽은 PID의 캐시 정리
+        for pid in seen.keys() - current_pids:
+            del seen[pid]
+
+        # 새로 생긴 PID만 이름을 읽어 검사
+        for pid in current_pids - seen.keys():
+            try:
+                proc_name = psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                seen[pid] = ''
+                continue
+            seen[pid] = proc_name
+
+            keyword = self._check_name(proc_name)
+            if keyword:
+                self._kill_and_report(pid, proc_name, keyword)
+
+        self._flush_logs()
 
     def stop(self):
-        self.running = False
-        self.quit()
+        self._stop_evt.set()  # WMI/폴링 루프 모두 이 이벤트로 즉시 종료
         self.wait()
 
 # ---------------------------------------------------------
 # [메인 로직] UI와 기능을 연결하는 컨트롤러
 # ---------------------------------------------------------
 class StudyWithLogic(StudyWithUI):
+    # 표시할 타이머 문자열이 바뀌었을 때만 발생
+    time_changed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__() # UI 초기화 (ui.py의 init_ui 실행됨)
         
         # 상태 변수 초기화
         self.is_running = False
         self.log_mode = False
+        self._log_sink = self._discard_log  # 로그 모드에 따라 교체되는 출력 함수
         self.current_state = "READY"
         self.time_left = 0
+        self._deadline = 0.0  # 현재 구간이 끝나는 monotonic 시각
+        self._last_tick = 0.0  # 마지막 틱의 monotonic 시각 (집중 시간 누적용)
+        self._last_shown = None  # 마지막으로 라벨에 표시한 문자열
+        self._last_pip_key = None  # 마지막으로 PIP 스타일을 적용한 (등급, 상태)
         self.total_cycles = 0
         self.current_cycle = 0
-        self.current_sites = []
-        self.current_apps = []
+        self.current_sites = ()
+        self.current_apps = ()
+        self._norm_apps = ()  # 소문자 정규화된 차단 앱 키워드 (세션 시작 시 계산)
         
         # 세션 기록 관리 (먼저 초기화)
         try:
@@ -310,6 +659,10 @@ class StudyWithLogic(StudyWithUI):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_timer)
 
+        # 타이머 문자열은 시그널 하나로 배포
+        # (두 라벨에 각각 setText를 부르는 대신 emit 한 번)
+        self.time_changed.connect(self._set_time_text)
+
         # ★ UI 이벤트 연결 (버튼 클릭 등)
         self.start_btn.clicked.connect(self.toggle_session)
         self.save_btn.clicked.connect(self.save_preset)
@@ -358,14 +711,12 @@ class StudyWithLogic(StudyWithUI):
             except Exception as e:
                 print(f"이전 프리셋 자동 로딩 실패: {e}")
 
-        #사운드 플레이어 설정
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(1.0) # 볼륨 100% (0.0 ~ 1.0)
-        
+        # 사운드 파일별 (QMediaPlayer, QAudioOutput) 풀
+        # 첫 재생 시점에 파일 단위로 생성 후 재사용 (QtMultimedia 임포트 지연)
+        self._sfx = {}
+
         # 격려 메시지 리스트
-        self.encouragement_messages = [
+        self.encouragement_messages = (
             "잘하고 있어요! 집중력을 유지하고 계세요! 💪",
             "훌륭해요! 방해 요소를 차단하고 계시네요! 🌟",
             "좋아요! 이렇게 계속 집중하시면 목표를 달성할 수 있어요! ✨",
@@ -378,16 +729,44 @@ class StudyWithLogic(StudyWithUI):
             "멋진 모습이에요! 계속 이렇게 집중하시면 성공할 거예요! 🏆",
             "화이팅! 지금의 노력이 당신을 더 강하게 만듭니다! 💫",
             "잘하고 있어요! 집중하는 시간이 당신의 자산입니다! 🌟"
-        ]
+        )
+        # 차단마다 random.choice를 부르는 대신 미리 섞어 둔 순서를 순회
+        # (같은 메시지가 연달아 나오는 일도 없어짐)
+        self._enc_order = list(range(len(self.encouragement_messages)))
+        random.shuffle(self._enc_order)
+        self._enc_ptr = 0
+
+    def _get_sound_player(self, sound_path):
+        """사운드 파일별 플레이어를 만들어 재사용합니다.
+
+        번들 사운드가 mp3라 QSoundEffect(비압축 PCM 전용)는 쓸 수 없으므로,
+        파일마다 소스를 고정한 QMediaPlayer를 풀에 보관해 반복 재생 시
+        setSource와 디코더 초기화 비용을 없앤다.
+        """
+        entry = self._sfx.get(sound_path)
+        if entry is None:
+            # QtMultimedia는 첫 재생 시점에만 임포트
+            # (미디어 백엔드 로딩을 시작 경로에서 제거)
+            from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+            player = QMediaPlayer()
+            audio_output = QAudioOutput()
+            player.setAudioOutput(audio_output)
+            audio_output.setVolume(1.0) # 볼륨 100% (0.0 ~ 1.0)
+            player.setSource(QUrl.fromLocalFile(sound_path))
+            # QAudioOutput이 GC되지 않도록 플레이어와 함께 보관
+            entry = (player, audio_output)
+            self._sfx[sound_path] = entry
+        return entry[0]
 
     def play_sound(self, file_name):
         """번들된 sounds 리소스의 mp3 파일을 재생합니다."""
         try:
             sound_path = resource_path("sounds", file_name)
-            
+
             if os.path.exists(sound_path):
-                self.player.setSource(QUrl.fromLocalFile(sound_path))
-                self.player.play()
+                player = self._get_sound_player(sound_path)
+                player.setPosition(0)  # 재사용 시 재생 위치를 처음으로
+                player.play()
                 self.handle_log(f"🔊 사운드 재생됨: {file_name}", "INFO")
             else:
                 self.handle_log(f"⚠️ 사운드 파일 없음: {file_name}", "WARNING")
@@ -408,6 +787,7 @@ class StudyWithLogic(StudyWithUI):
         # 메인창의 위치 근처에 띄우기 (선택사항)
         self.pip_window.move(self.x() + 50, self.y() + 50)
         self.pip_window.show() # PIP 창 표시
+        self._refresh_time_label()  # 다음 틱을 기다리지 않고 즉시 갱신
         self.handle_log("📺 PIP 모드로 전환되었습니다.", "INFO")
 
     def return_from_pip(self):
@@ -416,6 +796,7 @@ class StudyWithLogic(StudyWithUI):
         if self.pip_window is not None:
             self.pip_window.hide() # PIP 창 숨김
         self.show() # 메인 창 표시
+        self._refresh_time_label()  # PIP 동안 멈춰 있던 메인 라벨 즉시 갱신
         self.handle_log("🖥️ 메인 모드로 복귀했습니다.", "INFO")
     
     def show_stats(self):
@@ -451,17 +832,31 @@ class StudyWithLogic(StudyWithUI):
             return
         
         try:
-            self.pip_window.timer_label.setText(self.timer_label.text())
-            self.pip_window.status_label.setText(self.status_label.text())
-            
+            # 라벨은 내용이 실제로 바뀐 경우에만 갱신 (불필요한 리페인트 방지)
+            # 메인 라벨은 PIP 모드 동안 갱신되지 않으므로 라벨 텍스트를
+            # 복사하지 않고 남은 시간 상태에서 직접 포맷한다
+            new_time = self._current_time_str()
+            if self.pip_window.timer_label.text() != new_time:
+                self.pip_window.timer_label.setText(new_time)
+            new_status = self.status_label.text()
+            if self.pip_window.status_label.text() != new_status:
+                self.pip_window.status_label.setText(new_status)
+
             # 등급에 따른 테마 가져오기
             if self.session_manager is None:
-                theme = get_theme("BRONZE")
+                rank = "BRONZE"
             else:
                 stats = self.session_manager.get_statistics()
                 rank = stats.get("rank", "BRONZE")
-                theme = get_theme(rank)
-            
+
+            # setStyleSheet는 스타일 재계산을 유발하므로
+            # (등급, 상태) 조합이 바뀐 경우에만 실행
+            key = (rank, self.current_state)
+            if key == self._last_pip_key:
+                return
+            self._last_pip_key = key
+            theme = get_theme(rank)
+
             # 상태에 따라 색상 동기화 (등급 테마 반영)
             if self.current_state == "FOCUS":
                  self.pip_window.status_label.setStyleSheet(
@@ -487,19 +882,22 @@ class StudyWithLogic(StudyWithUI):
 
         # 파일 저장 대화상자 열기
         file_path, _ = QFileDialog.getSaveFileName(
-            self, 
-            "프리셋 저장", 
-            self.preset_dir, 
-            "Text Files (*.txt)"
+            self,
+            "프리셋 저장",
+            self.preset_dir,
+            "Preset Files (*.json);;Text Files (*.txt)"
         )
 
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("[SITES]\n")
-                    f.write(sites + "\n\n")
-                    f.write("[APPS]\n")
-                    f.write(apps + "\n")
+                # 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 원자적 교체
+                # (저장 중 강제 종료되어도 기존 프리셋이 깨지지 않음)
+                data = json.dumps(
+                    {"sites": sites, "apps": apps}, ensure_ascii=False, indent=2)
+                tmp_path = file_path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, file_path)
                 self.handle_log(f"💾 프리셋 저장 완료: {os.path.basename(file_path)}", "SUCCESS")
                 QMessageBox.information(self, "성공", "프리셋이 저장되었습니다.")
             except Exception as e:
@@ -516,10 +914,10 @@ class StudyWithLogic(StudyWithUI):
         # 파일 경로가 제공되지 않으면 파일 대화상자 열기
         if preset_path is None:
             file_path, _ = QFileDialog.getOpenFileName(
-                self, 
-                "프리셋 불러오기", 
-                self.preset_dir, 
-                "Text Files (*.txt)"
+                self,
+                "프리셋 불러오기",
+                self.preset_dir,
+                "Preset Files (*.json *.txt)"
             )
         else:
             file_path = preset_path
@@ -529,18 +927,7 @@ class StudyWithLogic(StudyWithUI):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                # 내용 파싱 (간단한 섹션 구분)
-                sites_text = ""
-                apps_text = ""
-                
-                # [SITES] 섹션 찾기
-                if "[SITES]" in content:
-                    parts = content.split("[SITES]")[1].split("[APPS]")
-                    sites_text = parts[0].strip()
-                    if len(parts) > 1:
-                        apps_text = parts[1].strip()
-                elif "[APPS]" in content: # APPS만 있는 경우
-                    apps_text = content.split("[APPS]")[1].strip()
+                sites_text, apps_text = self._parse_preset(content)
                 
                 # UI에 반영
                 self.site_input.setText(sites_text)
@@ -557,17 +944,54 @@ class StudyWithLogic(StudyWithUI):
                 else:
                     # 자동 로딩 실패는 조용히 처리
                     print(f"자동 프리셋 로딩 실패: {e}")
-        
+
+    @staticmethod
+    def _parse_preset(content: str) -> tuple[str, str]:
+        """프리셋 내용에서 (sites, apps) 텍스트 추출
+
+        새 형식은 JSON({"sites": ..., "apps": ...})이고, 예전 [SITES]/[APPS]
+        구분자 형식도 마이그레이션을 위해 계속 읽는다.
+        """
+        stripped = content.lstrip()
+        if stripped.startswith("{"):
+            data = json.loads(stripped)
+            return str(data.get("sites", "")), str(data.get("apps", ""))
+
+        # 레거시 형식: partition은 한 번의 스캔으로 구분자 앞/뒤를 돌려주므로
+        # in 검사 + split 조합처럼 내용을 여러 번 훑지 않는다
+        _, sites_marker, after_sites = content.partition("[SITES]")
+        if sites_marker:
+            sites_text, _, apps_text = after_sites.partition("[APPS]")
+        else:  # APPS만 있는 경우
+            sites_text = ""
+            _, _, apps_text = content.partition("[APPS]")
+        return sites_text.strip(), apps_text.strip()
+
     # --- 로직 메서드 구현 ---
     
     def toggle_log_mode(self, state):
         self.log_mode = (state == 2)
+        # 로그마다 플래그를 검사하는 대신 토글 시점에 출력 함수 자체를 교체
+        self._log_sink = self.append_log_ui if self.log_mode else self._discard_log
         self.log_viewer.setVisible(self.log_mode)
 
+    @staticmethod
+    def _discard_log(message, msg_type="INFO"):
+        """로그 모드가 꺼져 있을 때 사용하는 무시용 출력 함수"""
+
     def handle_log(self, message, msg_type="INFO"):
-        """로그 발생 시 처리"""
-        if self.log_mode:
-            self.append_log_ui(message, msg_type)
+        """로그 발생 시 처리
+
+        handle_log 자체는 시그널과 StatsWindow에 연결되어 있으므로 이름을
+        유지하고, 내부에서 교체 가능한 _log_sink로 위임한다.
+        """
+        self._log_sink(message, msg_type)
+
+    def handle_log_batch(self, entries):
+        """차단 스레드가 틱 단위로 묶어 보낸 (메시지, 유형) 목록 처리"""
+        sink = self._log_sink
+        for message, msg_type in entries:
+            sink(message, msg_type)
 
     def toggle_session(self):
         if not self.is_running: self.start_session()
@@ -577,16 +1001,21 @@ class StudyWithLogic(StudyWithUI):
         """차단 기능을 활성화합니다."""
         self.api_server.update_state(True, self.current_sites)
         
-        if self.blocker_thread is None or not self.blocker_thread.isRunning():
-            self.blocker_thread = BlockerWorker(self.current_apps)
-            self.blocker_thread.log_signal.connect(self.handle_log)
+        # 차단할 앱이 없으면 감시 스레드 자체를 만들지 않음
+        if self.current_apps and (self.blocker_thread is None or not self.blocker_thread.isRunning()):
+            self.blocker_thread = BlockerWorker(self._norm_apps)
+            self.blocker_thread.log_signal.connect(self.handle_log_batch)
             self.blocker_thread.blocked_signal.connect(self.show_encouragement_message)
             self.blocker_thread.start()
         self.handle_log("🛡️ 차단 기능이 활성화되었습니다.", "INFO")
     
     def show_encouragement_message(self, proc_name):
         """차단 발생 시 격려 메시지를 랜덤으로 표시합니다."""
-        message = random.choice(self.encouragement_messages)
+        message = self.encouragement_messages[self._enc_order[self._enc_ptr]]
+        self._enc_ptr = (self._enc_ptr + 1) % len(self._enc_order)
+        if self._enc_ptr == 0:
+            # 한 바퀴 돌면 다음 순서를 새로 섞음
+            random.shuffle(self._enc_order)
         title = f"🚫 프로그램 차단됨: {proc_name}"
         QMessageBox.information(self, title, message)
 
@@ -601,8 +1030,13 @@ class StudyWithLogic(StudyWithUI):
 
     def start_session(self):
             # 1. 입력값 저장 (세션 동안 계속 쓰기 위해)
-            self.current_sites = [s.strip() for s in self.site_input.text().split(',') if s.strip()]
-            self.current_apps = [a.strip() for a in self.app_input.text().split(',') if a.strip()]
+            # 세션 동안 바뀌지 않는 값이므로 한 번만 파싱해 불변 튜플로 보관
+            self.current_sites = tuple(
+                s.strip() for s in self.site_input.text().split(',') if s.strip())
+            self.current_apps = tuple(
+                a.strip() for a in self.app_input.text().split(',') if a.strip())
+            # 워커 생성 때마다 다시 변환하지 않도록 세션 시작 시 한 번만 정규화
+            self._norm_apps = tuple(a.lower() for a in self.current_apps)
 
             # 2. 상태 초기화
             self.is_running = True
@@ -631,7 +1065,7 @@ class StudyWithLogic(StudyWithUI):
         if self.session_start_time and self.session_manager is not None:
             try:
                 end_time = datetime.now()
-                total_focus_minutes = self.total_focus_seconds // 60
+                total_focus_minutes = int(self.total_focus_seconds // 60)
                 completed_cycles = self.current_cycle - 1 if self.current_state == "FOCUS" else self.current_cycle
                 
                 self.session_manager.add_session(
@@ -656,6 +1090,7 @@ class StudyWithLogic(StudyWithUI):
                 traceback.print_exc()
 
         self.current_state = "READY"
+        self.time_left = 0  # 라벨 포맷 기준값도 초기화 (PIP 동기화와 일치)
         self.timer_label.setText("00:00")
         self.status_label.setText("준비 상태")
         self.start_btn.setText("세션 시작")
@@ -670,6 +1105,10 @@ class StudyWithLogic(StudyWithUI):
     def enter_focus_mode(self):
         self.current_state = "FOCUS"
         self.time_left = self.focus_input.value() * 60
+        # 매 틱 정수를 깎는 대신 종료 시각을 한 번 계산 (타이머 드리프트 방지)
+        self._deadline = time.monotonic() + self.time_left
+        self._last_tick = time.monotonic()
+        self._last_shown = None
         self.status_label.setText(f"🔥 집중 중 ({self.current_cycle}/{self.total_cycles})")
         self.status_label.setStyleSheet("color: #D08770; font-weight: bold;")
 
@@ -682,6 +1121,9 @@ class StudyWithLogic(StudyWithUI):
     def enter_break_mode(self):
         self.current_state = "BREAK"
         self.time_left = self.break_input.value() * 60
+        self._deadline = time.monotonic() + self.time_left
+        self._last_tick = time.monotonic()
+        self._last_shown = None
         self.status_label.setText(f"☕ 휴식 시간 ({self.current_cycle}/{self.total_cycles})")
         self.status_label.setStyleSheet("color: #A3BE8C; font-weight: bold;")
 
@@ -691,25 +1133,56 @@ class StudyWithLogic(StudyWithUI):
         self.timer.start(1000)
         self.handle_log(f"☕ 휴식 모드 시작 (Cycle {self.current_cycle})", "INFO")
 
-    def update_timer(self):
-            minutes = self.time_left // 60
-            seconds = self.time_left % 60
-            time_str = f"{minutes:02}:{seconds:02}"
-            
-            # [중요] 메인 창과 PIP 창 모두 시간 업데이트
+    def _current_time_str(self):
+        """남은 시간(time_left)을 mm:ss 문자열로 포맷"""
+        return f"{self.time_left // 60:02}:{self.time_left % 60:02}"
+
+    def _set_time_text(self, time_str):
+        """time_changed 시그널 수신부: 현재 보이는 타이머 라벨만 갱신"""
+        if not self.is_pip_mode:
             self.timer_label.setText(time_str)
-            if self.is_pip_mode and self.pip_window is not None:
-                try:
-                    self.pip_window.timer_label.setText(time_str)
-                except Exception as e:
-                    print(f"PIP 타이머 업데이트 오류: {e}")
+        elif self.pip_window is not None and self.pip_window.isVisible():
+            self.pip_window.timer_label.setText(time_str)
 
-            if self.time_left > 0:
-                self.time_left -= 1
-                # 집중 모드일 때만 집중 시간 카운트
-                if self.current_state == "FOCUS":
-                    self.total_focus_seconds += 1
+    def _refresh_time_label(self):
+        """보이게 된 쪽 타이머 라벨을 현재 값으로 즉시 갱신
+
+        PIP 전환/복귀 직후 다음 틱(최대 1초)까지 이전 값이 남아
+        보이지 않도록 틱을 기다리지 않고 바로 반영한다.
+        """
+        time_str = self._current_time_str()
+        self._last_shown = time_str
+        self._set_time_text(time_str)
+
+    def update_timer(self):
+            # 종료 시각 기준으로 남은 시간 재계산 (틱이 밀려도 오차 누적 없음)
+            now = time.monotonic()
+            remaining = max(0, int(round(self._deadline - now)))
+            self.time_left = remaining
+
+            # 집중 시간은 틱 횟수가 아니라 실제 경과 시간으로 누적
+            # (틱 누락/지연이 있어도 저장되는 집중 시간이 정확)
+            if self.current_state == "FOCUS":
+                self.total_focus_seconds += now - self._last_tick
+            self._last_tick = now
+
+            # 창이 하나도 보이지 않으면 포맷/갱신을 건너뛰고 시간 상태만
+            # 누적. isVisible()은 최소화 상태에서도 True이므로 이 분기는
+            # 명시적으로 hide()된 창만 거른다 (PIP 전환 시의 메인 창 등)
+            show_main = self.isVisible() and not self.is_pip_mode
+            show_pip = (self.is_pip_mode and self.pip_window is not None
+                        and self.pip_window.isVisible())
+            if show_main or show_pip:
+                time_str = self._current_time_str()
+
+                # [중요] 표시 값이 실제로 바뀐 경우에만 시그널 발생
+                if time_str != self._last_shown:
+                    self._last_shown = time_str
+                    self.time_changed.emit(time_str)
             else:
+                self._last_shown = None  # 다시 보일 때 즉시 갱신되도록
+
+            if remaining <= 0:
                 self.timer.stop()
                 if self.current_state == "FOCUS":
                     self.play_sound("focus_end.mp3")
@@ -729,7 +1202,7 @@ class StudyWithLogic(StudyWithUI):
         if self.session_start_time and self.session_manager is not None:
             try:
                 end_time = datetime.now()
-                total_focus_minutes = self.total_focus_seconds // 60
+                total_focus_minutes = int(self.total_focus_seconds // 60)
                 
                 self.session_manager.add_session(
                     start_time=self.session_start_time,
@@ -770,9 +1243,34 @@ class StudyWithLogic(StudyWithUI):
             print(f"완료 메시지 표시 오류: {e}")
             QMessageBox.information(self, "완료", "모든 집중 세션을 완료했습니다! 🎉")
 
+class _FontLoaderSignals(QObject):
+    loaded = pyqtSignal(bytes)
+
+
+class _FontLoader(QRunnable):
+    """폰트 파일을 백그라운드 스레드에서 읽어 GUI 스레드로 전달
+
+    디스크 읽기를 첫 프레임과 겹쳐 수행하고, 실제 폰트 등록은
+    시그널을 받아 GUI 스레드에서 처리한다.
+    """
+
+    def __init__(self, font_file, signals):
+        super().__init__()
+        self._font_file = font_file
+        self._signals = signals
+
+    def run(self):
+        try:
+            with open(self._font_file, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+        self._signals.loaded.emit(data)
+
+
 def main() -> None:
     # Windows에서 콘솔 창 숨기기
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         import ctypes
         # 콘솔 창 숨기기
         kernel32 = ctypes.windll.kernel32
@@ -783,7 +1281,9 @@ def main() -> None:
     
     # Windows에서만 관리자 권한 승격 시도 (Linux/macOS는 여기서 자동 승격 불가)
     # 주의: run_as_admin()이 호출되면 현재 프로세스가 종료되고 새 프로세스가 시작됨
-    if platform.system() == "Windows" and not is_admin():
+    # 승격 경계를 이미 한 번 지난 프로세스는 argv 마커로 판별하고 재시도하지 않음
+    if (_IS_WINDOWS and '--elevated' not in sys.argv
+            and not is_admin()):
         try:
             run_as_admin()
             # run_as_admin()이 성공하면 여기 도달하지 않음 (sys.exit 호출됨)
@@ -795,24 +1295,32 @@ def main() -> None:
     try:
         app = QApplication(sys.argv)
 
-        font_file = resource_path("font.ttf")
-        font_id = QFontDatabase.addApplicationFont(font_file)
-        if font_id != -1:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            app.setFont(QFont(font_family, 10))
-            print(f"폰트 로드 성공: {font_family}")
-        else:
-            print("폰트 파일을 찾을 수 없거나 로드 실패 (기본 폰트 사용)")
-
         window = StudyWithLogic()
         window.show()
+
+        # 커스텀 폰트는 창을 먼저 띄운 뒤 백그라운드에서 읽어 적용
+        # (콜드 디스크에서 폰트 파일 읽기가 첫 화면을 막지 않도록)
+        def _apply_font(data: bytes) -> None:
+            font_id = QFontDatabase.addApplicationFontFromData(data)
+            if font_id != -1:
+                font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
+                app.setFont(QFont(font_family, 10))
+                print(f"폰트 로드 성공: {font_family}")
+            else:
+                print("폰트 파일을 찾을 수 없거나 로드 실패 (기본 폰트 사용)")
+
+        font_signals = _FontLoaderSignals()
+        font_signals.loaded.connect(_apply_font)
+        QThreadPool.globalInstance().start(
+            _FontLoader(resource_path("font.ttf"), font_signals))
+
         sys.exit(app.exec())
     except Exception as e:
         print(f"애플리케이션 실행 오류: {e}")
         import traceback
         traceback.print_exc()
         # 오류 발생 시에도 콘솔 창을 다시 보여서 오류 메시지 확인 가능하게
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             try:
                 kernel32 = ctypes.windll.kernel32
                 user32 = ctypes.windll.user32
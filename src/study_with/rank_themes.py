@@ -1,13 +1,22 @@
 """등급별 테마 및 스타일 정의"""
-from typing import Dict
+import string
+from typing import Dict, Tuple
 
 # 폰트 이름 (app.py에서 설정됨)
 _custom_font_name: str = ""
 
+# 완성된 스타일시트 캐시 — (종류, 등급) 키
+# 등급 변경이나 PIP 전환 때마다 ~2KB 문자열을 다시 조립하지 않도록
+# 한 번 만든 결과를 재사용한다. 폰트 이름이 바뀌면 전체를 비운다.
+_style_cache: Dict[Tuple[str, str], str] = {}
+
 def set_custom_font_name(font_name: str) -> None:
     """커스텀 폰트 이름 설정 (app.py에서 호출)"""
     global _custom_font_name
+    if font_name == _custom_font_name:
+        return
     _custom_font_name = font_name
+    _style_cache.clear()
 
 def get_custom_font_name() -> str:
     """로드된 커스텀 폰트 이름 반환"""
@@ -138,84 +147,82 @@ def get_theme(rank: str) -> Dict[str, str]:
     """등급에 해당하는 테마 반환"""
     return RANK_THEMES.get(rank, RANK_THEMES["BRONZE"])
 
-def get_default_style() -> str:
-    """기본 스타일 반환 (심플 모드용)"""
-    font_name = get_custom_font_name()
-    font_family = f"'{font_name}', " if font_name else ""
-    return f"""
-        * {{
-            font-family: {font_family}'Malgun Gothic', 'Segoe UI', sans-serif;
+# 스타일시트 템플릿 — import 시 한 번만 파싱해 두고
+# 빌더는 등급별 색상과 폰트 조각만 치환한다.
+_DEFAULT_TEMPLATE = string.Template("""
+        * {
+            font-family: $font_family'Malgun Gothic', 'Segoe UI', sans-serif;
             font-size: 14px;
-        }}
+        }
 
-        QMainWindow {{ 
+        QMainWindow { 
             background-color: #2E3440;
-        }}
+        }
         
-        QLabel {{ 
+        QLabel { 
             color: #ECEFF4; 
-        }}
+        }
 
-        #TitleLabel {{ 
+        #TitleLabel { 
             font-size: 24px; 
             font-weight: bold; 
             margin-top: 10px; 
             color: #88C0D0; 
-        }}
+        }
         
-        #TimerLabel {{ 
+        #TimerLabel { 
             font-size: 70px; 
             font-weight: bold; 
             color: #ECEFF4; 
             margin: 10px 0; 
-        }}
+        }
         
-        #StatusLabel {{ 
+        #StatusLabel { 
             font-size: 18px; 
             margin-bottom: 20px; 
             color: #ECEFF4;
-        }}
+        }
         
-        QFrame#SettingsFrame {{ 
+        QFrame#SettingsFrame { 
             background-color: rgba(59, 66, 82, 180); 
             border: 2px solid #4C566A;
             border-radius: 10px; 
             padding: 10px; 
             margin: 10px; 
-        }}
+        }
         
-        QLineEdit, QSpinBox {{ 
+        QLineEdit, QSpinBox { 
             background-color: rgba(76, 86, 106, 200); 
             color: white; 
             border: 2px solid #4C566A; 
             padding: 5px; 
             border-radius: 5px; 
-        }}
+        }
         
-        QLineEdit:focus, QSpinBox:focus {{
+        QLineEdit:focus, QSpinBox:focus {
             border: 2px solid #5E81AC;
             background-color: rgba(76, 86, 106, 250);
-        }}
+        }
         
         /* QSpinBox 위아래 버튼 스타일 */
-        QSpinBox::up-button, QSpinBox::down-button {{
+        QSpinBox::up-button, QSpinBox::down-button {
             background-color: rgba(94, 129, 172, 200);
             border: none;
             border-radius: 3px;
             width: 20px;
             min-width: 20px;
             max-width: 20px;
-        }}
+        }
         
-        QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
+        QSpinBox::up-button:hover, QSpinBox::down-button:hover {
             background-color: rgba(129, 161, 193, 250);
-        }}
+        }
         
-        QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {{
+        QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {
             background-color: rgba(76, 86, 106, 250);
-        }}
+        }
         
-        QSpinBox::up-arrow {{
+        QSpinBox::up-arrow {
             image: none;
             border-left: 4px solid transparent;
             border-right: 4px solid transparent;
@@ -224,13 +231,13 @@ def get_default_style() -> str:
             height: 0px;
             margin-left: 2px;
             margin-right: 2px;
-        }}
+        }
         
-        QSpinBox::up-arrow:hover {{
+        QSpinBox::up-arrow:hover {
             border-bottom: 5px solid #88C0D0;
-        }}
+        }
         
-        QSpinBox::down-arrow {{
+        QSpinBox::down-arrow {
             image: none;
             border-left: 4px solid transparent;
             border-right: 4px solid transparent;
@@ -239,28 +246,28 @@ def get_default_style() -> str:
             height: 0px;
             margin-left: 2px;
             margin-right: 2px;
-        }}
+        }
         
-        QSpinBox::down-arrow:hover {{
+        QSpinBox::down-arrow:hover {
             border-top: 5px solid #88C0D0;
-        }}
+        }
         
-        QCheckBox {{ 
+        QCheckBox { 
             color: #ECEFF4; 
             spacing: 5px; 
-        }}
+        }
         
-        QTextEdit#LogViewer {{
+        QTextEdit#LogViewer {
             background-color: #242933; 
             color: #ECEFF4; 
             border: 2px solid #4C566A; 
             border-radius: 5px; 
             padding: 5px; 
-            font-family: {font_family}'Consolas', monospace; 
+            font-family: $font_family'Consolas', monospace; 
             font-size: 12px; 
-        }}
+        }
         
-        QPushButton#StartBtn {{ 
+        QPushButton#StartBtn { 
             background-color: #5E81AC; 
             color: white; 
             font-size: 18px; 
@@ -268,104 +275,99 @@ def get_default_style() -> str:
             padding: 15px; 
             border-radius: 10px; 
             margin: 10px; 
-        }}
-        QPushButton#StartBtn:hover {{ 
+        }
+        QPushButton#StartBtn:hover { 
             background-color: #81A1C1; 
-        }}
+        }
         
-        QPushButton#PipBtn {{ 
+        QPushButton#PipBtn { 
             background-color: #4C566A; 
             border: 1px solid #5E81AC; 
             border-radius: 5px; 
             color: #ECEFF4;
             padding: 5px 10px;
             font-size: 12px;
-        }}
-        QPushButton#PipBtn:hover {{ 
+        }
+        QPushButton#PipBtn:hover { 
             background-color: #5E81AC; 
-        }}
-    """
+        }
+    """)
 
-def get_main_window_style(rank: str) -> str:
-    """메인 창 스타일 반환 (포인트 색상만 변경)"""
-    theme = get_theme(rank)
-    font_name = get_custom_font_name()
-    font_family = f"'{font_name}', " if font_name else ""
-    return f"""
-        * {{
-            font-family: {font_family}'Malgun Gothic', 'Segoe UI', sans-serif;
+_MAIN_TEMPLATE = string.Template("""
+        * {
+            font-family: $font_family'Malgun Gothic', 'Segoe UI', sans-serif;
             font-size: 14px;
-        }}
+        }
 
-        QMainWindow {{ 
+        QMainWindow { 
             background-color: #2E3440;
-        }}
+        }
         
-        QLabel {{ 
+        QLabel { 
             color: #ECEFF4; 
-        }}
+        }
 
-        #TitleLabel {{ 
+        #TitleLabel { 
             font-size: 24px; 
             font-weight: bold; 
             margin-top: 10px; 
-            color: {theme['accent_color']}; 
-        }}
+            color: $accent_color; 
+        }
         
-        #TimerLabel {{ 
+        #TimerLabel { 
             font-size: 70px; 
             font-weight: bold; 
-            color: {theme['accent_color']}; 
+            color: $accent_color; 
             margin: 10px 0; 
-            text-shadow: 0 0 5px {theme['accent_color']};
-        }}
+            text-shadow: 0 0 5px $accent_color;
+        }
         
-        #StatusLabel {{ 
+        #StatusLabel { 
             font-size: 18px; 
             margin-bottom: 20px; 
             color: #ECEFF4;
-        }}
+        }
         
-        QFrame#SettingsFrame {{ 
+        QFrame#SettingsFrame { 
             background-color: rgba(59, 66, 82, 180); 
-            border: 2px solid {theme['accent_color']};
+            border: 2px solid $accent_color;
             border-radius: 10px; 
             padding: 10px; 
             margin: 10px; 
-        }}
+        }
         
-        QLineEdit, QSpinBox {{ 
+        QLineEdit, QSpinBox { 
             background-color: rgba(76, 86, 106, 200); 
             color: white; 
             border: 2px solid #4C566A; 
             padding: 5px; 
             border-radius: 5px; 
-        }}
+        }
         
-        QLineEdit:focus, QSpinBox:focus {{
-            border: 2px solid {theme['accent_color']};
+        QLineEdit:focus, QSpinBox:focus {
+            border: 2px solid $accent_color;
             background-color: rgba(76, 86, 106, 250);
-        }}
+        }
         
         /* QSpinBox 위아래 버튼 스타일 (티어별 색상 적용) */
-        QSpinBox::up-button, QSpinBox::down-button {{
+        QSpinBox::up-button, QSpinBox::down-button {
             background-color: rgba(94, 129, 172, 200);
             border: none;
             border-radius: 3px;
             width: 20px;
             min-width: 20px;
             max-width: 20px;
-        }}
+        }
         
-        QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
-            background-color: {theme['accent_color']};
-        }}
+        QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+            background-color: $accent_color;
+        }
         
-        QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {{
-            background-color: {theme['border_color']};
-        }}
+        QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {
+            background-color: $border_color;
+        }
         
-        QSpinBox::up-arrow {{
+        QSpinBox::up-arrow {
             image: none;
             border-left: 4px solid transparent;
             border-right: 4px solid transparent;
@@ -374,13 +376,13 @@ def get_main_window_style(rank: str) -> str:
             height: 0px;
             margin-left: 2px;
             margin-right: 2px;
-        }}
+        }
         
-        QSpinBox::up-arrow:hover {{
-            border-bottom: 5px solid {theme['accent_color']};
-        }}
+        QSpinBox::up-arrow:hover {
+            border-bottom: 5px solid $accent_color;
+        }
         
-        QSpinBox::down-arrow {{
+        QSpinBox::down-arrow {
             image: none;
             border-left: 4px solid transparent;
             border-right: 4px solid transparent;
@@ -389,88 +391,144 @@ def get_main_window_style(rank: str) -> str:
             height: 0px;
             margin-left: 2px;
             margin-right: 2px;
-        }}
+        }
         
-        QSpinBox::down-arrow:hover {{
-            border-top: 5px solid {theme['accent_color']};
-        }}
+        QSpinBox::down-arrow:hover {
+            border-top: 5px solid $accent_color;
+        }
         
-        QCheckBox {{ 
+        QCheckBox { 
             color: #ECEFF4; 
             spacing: 5px; 
-        }}
+        }
         
-        QTextEdit#LogViewer {{ 
+        QTextEdit#LogViewer { 
             background-color: #242933; 
             color: #ECEFF4; 
             border: 2px solid #4C566A; 
             border-radius: 5px; 
             padding: 5px; 
-            font-family: {font_family}'Consolas', monospace; 
+            font-family: $font_family'Consolas', monospace; 
             font-size: 12px; 
-        }}
+        }
         
-        QPushButton#StartBtn {{ 
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {theme['accent_color']}, stop:1 {theme['border_color']});
+        QPushButton#StartBtn { 
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 $accent_color, stop:1 $border_color);
             color: #2E3440; 
             font-size: 18px; 
             font-weight: bold; 
             padding: 15px; 
             border-radius: 10px; 
             margin: 10px; 
-            border: 2px solid {theme['border_color']};
-        }}
-        QPushButton#StartBtn:hover {{ 
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {theme['border_color']}, stop:1 {theme['accent_color']});
-        }}
+            border: 2px solid $border_color;
+        }
+        QPushButton#StartBtn:hover { 
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 $border_color, stop:1 $accent_color);
+        }
         
-        QPushButton#PipBtn {{ 
+        QPushButton#PipBtn { 
             background-color: rgba(76, 86, 106, 200); 
             border: 2px solid #4C566A; 
             border-radius: 5px; 
             color: #ECEFF4;
             padding: 5px 10px;
             font-size: 12px;
-        }}
-        QPushButton#PipBtn:hover {{ 
-            background-color: {theme['accent_color']};
+        }
+        QPushButton#PipBtn:hover { 
+            background-color: $accent_color;
             color: #2E3440;
-        }}
-    """
+        }
+    """)
 
-def get_pip_style(rank: str) -> str:
-    """PIP 모드 스타일 반환 (포인트 색상만 변경)"""
-    theme = get_theme(rank)
-    font_name = get_custom_font_name()
-    font_family = f"'{font_name}', " if font_name else ""
-    return f"""
-        QFrame {{
+_PIP_TEMPLATE = string.Template("""
+        QFrame {
             background-color: rgba(46, 52, 64, 240);
             border-radius: 15px;
-            border: 3px solid {theme['accent_color']};
-        }}
-        QLabel {{ 
+            border: 3px solid $accent_color;
+        }
+        QLabel { 
             color: #ECEFF4; 
-            font-family: {font_family}'Segoe UI', sans-serif; 
+            font-family: $font_family'Segoe UI', sans-serif; 
             border: none; 
             background: transparent; 
-        }}
-    """
+        }
+    """)
 
-def get_default_pip_style() -> str:
-    """기본 PIP 모드 스타일 반환 (심플 모드용)"""
-    font_name = get_custom_font_name()
-    font_family = f"'{font_name}', " if font_name else ""
-    return f"""
-        QFrame {{
+_DEFAULT_PIP_TEMPLATE = string.Template("""
+        QFrame {
             background-color: rgba(46, 52, 64, 240);
             border-radius: 15px;
             border: 2px solid #4C566A;
-        }}
-        QLabel {{ 
+        }
+        QLabel { 
             color: #ECEFF4; 
-            font-family: {font_family}'Segoe UI', sans-serif; 
+            font-family: $font_family'Segoe UI', sans-serif; 
             border: none; 
             background: transparent; 
-        }}
-    """
+        }
+    """)
+
+def get_default_style() -> str:
+    """기본 스타일 반환 (심플 모드용)"""
+    key = ("default", "")
+    style = _style_cache.get(key)
+    if style is None:
+        style = _style_cache[key] = _build_default_style()
+    return style
+
+def _build_default_style() -> str:
+    """심플 모드 스타일시트 조립 (캐시 미스 때만 호출)"""
+    font_name = get_custom_font_name()
+    font_family = f"'{font_name}', " if font_name else ""
+    return _DEFAULT_TEMPLATE.substitute(font_family=font_family)
+
+def get_main_window_style(rank: str) -> str:
+    """메인 창 스타일 반환 (포인트 색상만 변경)"""
+    key = ("main", rank)
+    style = _style_cache.get(key)
+    if style is None:
+        style = _style_cache[key] = _build_main_window_style(rank)
+    return style
+
+def _build_main_window_style(rank: str) -> str:
+    """등급별 메인 창 스타일시트 조립 (캐시 미스 때만 호출)"""
+    theme = get_theme(rank)
+    font_name = get_custom_font_name()
+    font_family = f"'{font_name}', " if font_name else ""
+    return _MAIN_TEMPLATE.substitute(
+        accent_color=theme['accent_color'],
+        border_color=theme['border_color'],
+        font_family=font_family,
+    )
+
+def get_pip_style(rank: str) -> str:
+    """PIP 모드 스타일 반환 (포인트 색상만 변경)"""
+    key = ("pip", rank)
+    style = _style_cache.get(key)
+    if style is None:
+        style = _style_cache[key] = _build_pip_style(rank)
+    return style
+
+def _build_pip_style(rank: str) -> str:
+    """등급별 PIP 스타일시트 조립 (캐시 미스 때만 호출)"""
+    theme = get_theme(rank)
+    font_name = get_custom_font_name()
+    font_family = f"'{font_name}', " if font_name else ""
+    return _PIP_TEMPLATE.substitute(
+        accent_color=theme['accent_color'],
+        font_family=font_family,
+    )
+
+def get_default_pip_style() -> str:
+    """기본 PIP 모드 스타일 반환 (심플 모드용)"""
+    key = ("default_pip", "")
+    style = _style_cache.get(key)
+    if style is None:
+        style = _style_cache[key] = _build_default_pip_style()
+    return style
+
+def _build_default_pip_style() -> str:
+    """심플 모드 PIP 스타일시트 조립 (캐시 미스 때만 호출)"""
+    font_name = get_custom_font_name()
+    font_family = f"'{font_name}', " if font_name else ""
+    return _DEFAULT_PIP_TEMPLATE.substitute(font_family=font_family)
@@ -1,6 +1,7 @@
 """세션 기록 관리 및 통계 계산 모듈"""
 from __future__ import annotations
 
+import functools
 import json
 import os
 import platform
@@ -9,8 +10,9 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 
+@functools.lru_cache(maxsize=1)
 def _get_data_dir() -> Path:
-    """세션 데이터 저장 디렉토리 반환"""
+    """세션 데이터 저장 디렉토리 반환 (첫 호출 때만 경로 계산 + mkdir)"""
     system = platform.system()
     if system == "Windows":
         base = Path(os.getenv("APPDATA", str(Path.home() / "AppData" / "Roaming")))
@@ -48,14 +50,76 @@ class SessionManager:
                 self.sessions = []
         else:
             self.sessions = []
+        self._rebuild_aggregates()
+
+    def _rebuild_aggregates(self) -> None:
+        """증분 통계용 집계값을 전체 기록에서 한 번만 계산
+
+        이후에는 add_session이 집계값을 증분으로 갱신하므로
+        get_statistics가 기록 전체를 다시 훑지 않는다.
+        """
+        self._total_focus_minutes = sum(
+            s.get("total_focus_minutes", 0) for s in self.sessions)
+        self._total_cycles = sum(
+            s.get("completed_cycles", 0) for s in self.sessions)
+        self._completed_sessions = sum(
+            1 for s in self.sessions
+            if s.get("completed_cycles", 0) == s.get("total_cycles", 0))
+        self._dates = set()
+        for s in self.sessions:
+            d = s.get("date")
+            if d:
+                try:
+                    self._dates.add(datetime.fromisoformat(d).date())
+                except ValueError:
+                    pass
+        self._longest_streak = self._compute_longest_streak()
+
+    def _compute_longest_streak(self) -> int:
+        """기록된 날짜들의 최장 연속 일수"""
+        if not self._dates:
+            return 0
+        date_objs = sorted(self._dates)
+        longest_streak = 1
+        temp_streak = 1
+        for i in range(1, len(date_objs)):
+            if (date_objs[i] - date_objs[i - 1]).days == 1:
+                temp_streak += 1
+                longest_streak = max(longest_streak, temp_streak)
+            else:
+                temp_streak = 1
+        return longest_streak
+
+    def _run_length(self, day) -> int:
+        """day를 포함하는 연속 일수 길이 (이웃 날짜만 확인)"""
+        length = 1
+        d = day - timedelta(days=1)
+        while d in self._dates:
+            length += 1
+            d -= timedelta(days=1)
+        d = day + timedelta(days=1)
+        while d in self._dates:
+            length += 1
+            d += timedelta(days=1)
+        return length
     
     def save_sessions(self) -> None:
-        """세션 기록을 파일에 저장"""
+        """세션 기록을 파일에 저장
+
+        같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 원자적으로 교체한다.
+        저장 중 강제 종료돼도 기존 기록 파일이 잘리거나 깨지지 않는다.
+        """
+        tmp_path = self.sessions_file.with_suffix('.json.tmp')
         try:
-            with open(self.sessions_file, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(self.sessions, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.sessions_file)
         except Exception as e:
             print(f"세션 저장 실패: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
     
     def add_session(self, 
                    start_time: datetime,
@@ -77,6 +141,18 @@ class SessionManager:
             "date": start_time.date().isoformat()
         }
         self.sessions.append(session)
+
+        # 집계값 증분 갱신 (전체 재집계 없이 O(1))
+        self._total_focus_minutes += total_focus_minutes
+        self._total_cycles += completed_cycles
+        if completed_cycles == total_cycles:
+            self._completed_sessions += 1
+        day = start_time.date()
+        if day not in self._dates:
+            self._dates.add(day)
+            self._longest_streak = max(
+                self._longest_streak, self._run_length(day))
+
         self.save_sessions()
     
     def get_all_sessions(self) -> List[Dict]:
@@ -99,49 +175,27 @@ class SessionManager:
                 "rank_display": "브론즈"
             }
         
-        # 기본 통계
+        # 기본 통계 (add_session에서 유지되는 집계값 사용)
         total_sessions = len(self.sessions)
-        total_focus_minutes = sum(s.get("total_focus_minutes", 0) for s in self.sessions)
+        total_focus_minutes = self._total_focus_minutes
         total_focus_hours = total_focus_minutes / 60
-        total_cycles = sum(s.get("completed_cycles", 0) for s in self.sessions)
-        completed_sessions = sum(1 for s in self.sessions if s.get("completed_cycles", 0) == s.get("total_cycles", 0))
-        
-        # 연속 일수 계산
-        dates = sorted(set(s.get("date", "") for s in self.sessions if s.get("date")))
-        if not dates:
-            current_streak = 0
-            longest_streak = 0
-        else:
-            # 날짜를 datetime으로 변환하여 계산
-            date_objs = [datetime.fromisoformat(d).date() for d in dates]
-            date_objs.sort()
-            
-            # 현재 연속 일수
-            today = datetime.now().date()
-            current_streak = 0
-            check_date = today
-            # 오늘 또는 어제부터 역순으로 연속된 날짜 확인
-            while True:
-                if check_date in date_objs:
-                    current_streak += 1
-                    check_date -= timedelta(days=1)
-                elif check_date == today:
-                    # 오늘은 기록이 없지만, 어제부터 연속이면 계속 확인
-                    check_date -= timedelta(days=1)
-                else:
-                    # 연속이 끊김
-                    break
-            
-            # 최장 연속 일수
-            longest_streak = 1
-            temp_streak = 1
-            for i in range(1, len(date_objs)):
-                if (date_objs[i] - date_objs[i-1]).days == 1:
-                    temp_streak += 1
-                    longest_streak = max(longest_streak, temp_streak)
-                else:
-                    temp_streak = 1
-        
+        total_cycles = self._total_cycles
+        completed_sessions = self._completed_sessions
+
+        # 현재 연속 일수: 오늘(기록이 없으면 어제)부터 역순으로
+        # 날짜 set을 거슬러 올라가며 확인 — O(연속 일수)
+        today = datetime.now().date()
+        current_streak = 0
+        check_date = today
+        if check_date not in self._dates:
+            check_date -= timedelta(days=1)
+        while check_date in self._dates:
+            current_streak += 1
+            check_date -= timedelta(days=1)
+
+        # 최장 연속 일수는 add_session에서 증분 유지됨
+        longest_streak = self._longest_streak
+
         # 점수 계산
         # 집중 시간 1분 = 1점
         time_score = total_focus_minutes
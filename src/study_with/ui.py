@@ -1,4 +1,5 @@
 # ui.py
+import functools
 import os
 import sys
 from pathlib import Path
@@ -12,16 +13,18 @@ from datetime import datetime
 from .rank_themes import get_main_window_style, get_pip_style, get_theme, get_default_style, get_default_pip_style, RANK_THEMES
 from .web_effects import add_sparkle_effect, hex_to_qcolor
 
+@functools.lru_cache(maxsize=1)
 def _resources_dir() -> Path:
-    """리소스 디렉토리 반환"""
+    """리소스 디렉토리 반환 (결과는 고정이므로 캐싱)"""
     meipass = getattr(sys, "_MEIPASS", None)
     if meipass:
         return Path(meipass) / "resources"
     # ui.py는 src/study_with/ui.py에 있으므로 parent만 사용
     return Path(__file__).resolve().parent / "resources"
 
+@functools.lru_cache(maxsize=None)
 def resource_path(*relative_parts: str) -> str:
-    """리소스 파일 경로 반환"""
+    """리소스 파일 경로 반환 (같은 인자는 Path 조인 없이 캐시에서 반환)"""
     return str(_resources_dir().joinpath(*relative_parts))
 
 # ========================================================